@@ -5,10 +5,17 @@ import flet as ft
 from automata.fa.nfa import NFA
 import graphviz
 from graphviz import Digraph
+# Internal graphviz helpers, used by visualize_nfa; tied to graphviz==0.20.1 (requirements.txt)
+from graphviz.quoting import quote, quote_edge
 import re
 import sys
 import io
-from datetime import datetime
+import os
+import hashlib
+import types
+import linecache
+import pickle
+from collections import defaultdict
 
 
 # ======================
@@ -18,19 +25,22 @@ from datetime import datetime
 # Global Variables
 old_out = sys.stdout
 build_counter = 0
-ast_timestamp_string = ""
-timestamp_str = ""
-new_namespace = {}
-type_to_value = {}
 value_to_type = {}
-lex_counter = 0
+current_language = None  # (lexer, parser) of the most recently built language
+code_cache = {}
+parser_tables_dir = '.cache'
+lex_table_row_limit = 500
 sym_table = []
+sym_table_set = set()
 sem_errors = []
 sem_visual_removed = True
 
+# Matches a bracketed character class such as [a-z] in a token pattern
+_CHAR_CLASS_RE = re.compile(r'\[(.+?)\]')
+
 def traverse_ast_for_semantics(ast_node, assign_token, symbol_token):
     """
-    Recursively traverse the abstract syntax tree (AST) to perform semantic checks.
+    Traverse the abstract syntax tree (AST) in order to perform semantic checks.
     
     Specifically, it checks for:
     1. Variable re-declaration.
@@ -38,44 +48,101 @@ def traverse_ast_for_semantics(ast_node, assign_token, symbol_token):
     
     Parameters:
     - ast_node (tuple or None): A node in the AST, represented as a tuple.
-    - assign_token (str): Token that represents an assignment operator in the language.
+    - assign_token (str): Token type that represents an assignment operator in the language.
     - symbol_token (str): Token type that represents a variable or symbol in the language.
     """
     
     if ast_node is None or not isinstance(ast_node, tuple):
         return
 
-    for i, elem in enumerate(ast_node): 
-        if isinstance(elem, tuple):
-            traverse_ast_for_semantics(elem, assign_token, symbol_token)
+    # Nothing to check if the source code contains no symbol tokens at all
+    if symbol_token not in value_to_type.values():
+        return
+
+    get_type = value_to_type.get
+    syms = sym_table_set
+    symbols = sym_table
+    errors = sem_errors
+
+    # Explicit stack of (node, index to resume from) instead of recursion
+    stack = [(ast_node, 0)]
+    while stack:
+        node, start = stack.pop()
+        for i in range(start, len(node)):
+            elem = node[i]
+            if isinstance(elem, tuple):
+                stack.append((node, i + 1))
+                stack.append((elem, 0))
+                break
+            if get_type(elem) != symbol_token:
+                continue
+
+            # The preceding element may be a whole subtree, which is never the operator
+            prev = node[i-1] if i > 0 else None
+            is_assignment = prev is not None and not isinstance(prev, tuple) and get_type(prev) == assign_token
+            if elem in syms:
+                if is_assignment:
+                    errors.append([elem, "Variable has already been defined"])
+            elif is_assignment:
+                syms.add(elem)
+                symbols.append(elem)
+            else:
+                errors.append([elem, "Variable used before being defined"])
+
+def _tokenize_regex(regex):
+    """
+    Split a token pattern into the units read by the NFA in a single pass.
+    
+    Parameters:
+    - regex (str): The regular expression of a token.
+
+    Returns:
+    - list of tuples: (char_class, quantifier) pairs, where char_class is a bracketed
+                      class without brackets, an escape sequence or a single character,
+                      and quantifier is '+', '*', '?' or None.
+    """
+    units = []
+    length = len(regex)
+    i = 0
+    while i < length:
+        # Check for character class
+        match_char_class = _CHAR_CLASS_RE.match(regex, i)
+        if match_char_class:
+            char_class = match_char_class.group(1)  # Match without brackets
+            i = match_char_class.end()
+        elif regex[i] == '\\' and i + 1 < length:
+            char_class = regex[i:i+2]
+            i += 2
         else:
-            if value_to_type.get(elem) == symbol_token: 
-                if elem in sym_table:
-                    if i > 0 and ast_node[i-1] == assign_token:
-                        sem_errors.append([elem, "Variable has already been defined"])
-                else:
-                    if i > 0 and ast_node[i-1] == assign_token:
-                        sym_table.append(elem)
-                    else:
-                        sem_errors.append([ast_node[i], "Variable used before being defined"])  
+            char_class = regex[i]
+            i += 1
+
+        quantifier = None
+        if i < length and regex[i] in '+*?':
+            quantifier = regex[i]
+            i += 1
+
+        units.append((char_class, quantifier))
+    return units
 
 def generate_nfa(token_defs):
     """
-    Generate a Python code string that defines a Non-deterministic Finite Automaton (NFA)
-    for a given set of token definitions. The generated code can be executed to visualize 
-    the NFA using the automata-lib library.
+    Generate the components of a Non-deterministic Finite Automaton (NFA)
+    for a given set of token definitions. The components can be passed to the
+    automata-lib NFA class and visualized with visualize_nfa.
     
     Parameters:
     - token_defs (dict): A dictionary where keys are token names and values are regular expressions 
                          representing the token.
 
     Returns:
-    - str: A string containing Python code to generate and visualize the NFA.
+    - tuple: (states, input_symbols, transitions, final_states) describing the NFA,
+             with 'Start' as the initial state.
     """
     # Define the NFA attributes
     states = {'Start'}
     input_symbols = set()
-    transitions = {'Start': {}}
+    transitions = defaultdict(lambda: defaultdict(set))
     final_states = set()
 
     # Process each regular expression
@@ -84,95 +151,89 @@ def generate_nfa(token_defs):
         states.add(name)
         current_state = 'Start'
         
-        i = 0
-        while i < len(regex):
-            # Check for character class
-            match_char_class = re.match(r'\[(.+?)\]', regex[i:])
-            if match_char_class:
-                char_class = match_char_class.group(1)  # Match without brackets
-                i += len(match_char_class.group(0))
-            elif regex[i:].startswith('\\') and len(regex[i:]) > 1:
-                char_class = regex[i:i+2]
-                i += 2
-            else:
-                char_class = regex[i]
-                i += 1
-
+        for char_class, quantifier in _tokenize_regex(regex):
             char_read_state = f"{char_class}_Read"
             states.add(char_read_state)
             
             if len(char_class) > 1 and char_class.startswith('\\'):
                 char_class = char_class[1]
-
-            # Escape backslashes for string representation
-            char_class = char_class.replace("\\", "\\\\")
             
             input_symbols.add(char_class)
-            if char_class not in transitions[current_state]:
-                transitions[current_state][char_class] = set()
             transitions[current_state][char_class].add(char_read_state)
 
-            transitions[char_read_state] = {}
+            transitions[char_read_state] = defaultdict(set)
 
             # Handle quantifiers
-            if i < len(regex) and regex[i] in ['+', '*', '?']:
-                quantifier = regex[i]
-                i += 1
-                if quantifier == '+':
-                    transitions[char_read_state][char_class] = {char_read_state}
-                elif quantifier == '*':
-                    transitions[char_read_state][char_class] = {char_read_state}
-                    transitions[char_read_state][''] = {current_state, name}
-                    transitions[current_state][''] = {name}
-                elif quantifier == '?':
-                    if '' not in transitions[current_state]:
-                        transitions[current_state][''] = set()
-                    transitions[current_state][''].add(char_read_state)
+            if quantifier == '+':
+                transitions[char_read_state][char_class] = {char_read_state}
+            elif quantifier == '*':
+                transitions[char_read_state][char_class] = {char_read_state}
+                transitions[char_read_state][''] = {current_state, name}
+                transitions[current_state][''] = {name}
+            elif quantifier == '?':
+                transitions[current_state][''].add(char_read_state)
                 
             current_state = char_read_state
 
         transitions[current_state][''] = {name}
-        
 
-    states_str = ', '.join(f'"{sta}"' for sta in states)
-    input_symbols_str = ', '.join(f'"{sym}"' for sym in input_symbols)
-    transitions_str = ',\n        '.join(f"'{state}': {trans}" for state, trans in transitions.items())
-    final_states_str = ', '.join(f"'{state}'" for state in final_states)
+    # Convert back to plain dicts for automata-lib
+    transitions = {state: dict(paths) for state, paths in transitions.items()}
+    transitions.setdefault('Start', {})
 
-    # Generate the final string without backslashes in the f-string
-    nfa_str = f"""nfa = NFA(
-    states={{ {states_str} }},
-    input_symbols={{ {input_symbols_str} }},
-    transitions={{
-        {transitions_str}
-    }},
-    initial_state='Start',
-    final_states={{ {final_states_str} }}
-)
+    return states, input_symbols, transitions, final_states
 
-dot = graphviz.Digraph()
-
-for state in nfa.states:
-    if state in nfa.final_states:
-        dot.node(state, shape='doublecircle')
-    else:
-        dot.node(state)
-
-dot.node('', style='invisible')
-dot.edge('', nfa.initial_state)
-
-for from_state, transitions in nfa.transitions.items():
-    for input_symbol, to_states in transitions.items():
-        for to_state in to_states:
-            dot.edge(from_state, to_state, label=input_symbol)
+def visualize_nfa(nfa, output_file='nfa'):
+    """
+    Visualize a Non-deterministic Finite Automaton (NFA) as a state diagram.
+    
+    The image is named after a hash of the NFA, so an unchanged NFA reuses the
+    previously rendered file instead of invoking Graphviz again.
+    
+    Parameters:
+    - nfa (NFA): The automata-lib NFA to draw.
+    - output_file (str): The prefix of the output file name (without extension).
 
-nfafilename = f'nfa_{timestamp_str}'
-#nfafilename = "nfa"
+    Outputs:
+    - PNG file: A graphical representation of the NFA.
 
-dot.render(nfafilename, format='png')
-"""
-    
-    return nfa_str
+    Returns:
+    - str: The path of the PNG file.
+    """
+    nfa_key = repr((
+        sorted(nfa.states),
+        sorted(nfa.final_states),
+        sorted((from_state, sorted((symbol, sorted(to_states)) for symbol, to_states in transitions.items()))
+               for from_state, transitions in nfa.transitions.items())
+    ))
+    output_file = f"{output_file}_{hashlib.sha1(nfa_key.encode()).hexdigest()[:16]}"
+    if os.path.exists(f"{output_file}.png"):
+        return f"{output_file}.png"
+
+    dot = graphviz.Digraph()
+
+    # Write the DOT lines in bulk, quoting each state name only once.
+    # The line format mirrors Digraph.node/edge in graphviz 0.20.1 and must be
+    # re-checked against it if the graphviz pin in requirements.txt changes.
+    final_states = nfa.final_states
+    dot.body.extend(
+        f'\t{quote(state)} [shape=doublecircle]\n' if state in final_states else f'\t{quote(state)}\n'
+        for state in nfa.states
+    )
+
+    dot.node('', style='invisible')
+    dot.edge('', nfa.initial_state)
+
+    edge_names = {state: quote_edge(state) for state in nfa.states}
+    dot.body.extend(
+        f'\t{edge_names[from_state]} -> {edge_names[to_state]} [label={quote(input_symbol)}]\n'
+        for from_state, transitions in nfa.transitions.items()
+        for input_symbol, to_states in transitions.items()
+        for to_state in to_states
+    )
+
+    dot.render(output_file, format='png')
+    return f"{output_file}.png"
 
 def get_patterns_from_module(namespace):
     """
@@ -189,26 +250,29 @@ def get_patterns_from_module(namespace):
             and their patterns as values.
     """
     
-    patterns = {}
-    for name, value in namespace.items():
-        if name.startswith('t_') and name != 't_error':
-            if isinstance(value, str):  # for direct assignments
-                patterns[name[2:]] = value
-            else:  # for function-based patterns
-                patterns[name[2:]] = value.__doc__
-    
-    return patterns
+    # Direct string assignments are used as-is, functions provide their docstring
+    return {
+        name[2:]: value if isinstance(value, str) else value.__doc__
+        for name, value in namespace.items()
+        if name.startswith('t_') and name != 't_error'
+    }
 
 def visualize_ast(ast, output_file='ast_tree'):
     """
     Visualize an Abstract Syntax Tree (AST) represented as nested tuples.
     
+    The image is named after a hash of the generated DOT source, so an unchanged
+    AST reuses the previously rendered file instead of invoking Graphviz again.
+    
     Parameters:
     - ast (tuple): The AST represented as nested tuples.
-    - output_file (str): The name of the output file (without extension).
+    - output_file (str): The prefix of the output file name (without extension).
 
     Outputs:
     - PNG file: A graphical representation of the AST.
+
+    Returns:
+    - str: The path of the PNG file.
     """
     dot = Digraph(comment='AST for the code')
     
@@ -223,45 +287,55 @@ def visualize_ast(ast, output_file='ast_tree'):
         return child
 
     def build_tree(node, parent=None):
-        
-        if type(node) is tuple:
-            if type(node[0]) is tuple:
-                for child in node:
-                    build_tree(child, parent)
+        # Children are pushed in reverse so nodes are added in pre-order
+        stack = [(node, parent)]
+        while stack:
+            node, parent = stack.pop()
+            if type(node) is tuple:
+                if type(node[0]) is tuple:
+                    stack.extend((child, parent) for child in reversed(node))
+                else:
+                    node_id = add_node(parent, node[0])
+                    stack.extend((child, node_id) for child in reversed(node[1:]))
             else:
-                parent = add_node(parent, node[0])
-                for child in node[1:]:
-                    build_tree(child, parent)
-        else:
-            add_node(parent, node)
+                add_node(parent, node)
 
     root = 'root'
     dot.node(root, 'Program')
     build_tree(ast, root)
-    dot.render(output_file, format="png")
+
+    # Hash the DOT source rather than repr(ast), which recurses on deep ASTs
+    output_file = f"{output_file}_{hashlib.sha1(dot.source.encode()).hexdigest()[:16]}"
+    if not os.path.exists(f"{output_file}.png"):
+        dot.render(output_file, format="png")
+    return f"{output_file}.png"
 
 def get_lex_table(lexer):
     """
     Generate a table visualization of the tokens produced by the lexer.
     
+    Only the first lex_table_row_limit tokens get a row; any remaining tokens are
+    summarized in a final row so large inputs do not create thousands of controls.
+    
     Parameters:
     - lexer: An iterable lexer object that produces token objects with 'type' and 'value' attributes.
     
     Returns:
     - ft.DataTable: A table visualization with columns "Token Type" and "Token Value".
     """    
-    rows = []
+    DataRow, DataCell, Text = ft.DataRow, ft.DataCell, ft.Text
+    tokens = list(lexer)
     
-    for token in lexer:
+    for token in tokens:
         value_to_type[token.value] = token.type # Populate Lexer Value Dictionary
-        type_to_value[token.type] = token.value # Populate Lexer Type Dictionary
-        row = ft.DataRow(
-            cells=[
-                ft.DataCell(ft.Text(token.type)),
-                ft.DataCell(ft.Text(token.value))
-            ]
-        )
-        rows.append(row)
+
+    rows = [
+        DataRow(cells=[DataCell(Text(token.type)), DataCell(Text(token.value))])
+        for token in tokens[:lex_table_row_limit]
+    ]
+    if len(tokens) > lex_table_row_limit:
+        hidden = len(tokens) - lex_table_row_limit
+        rows.append(DataRow(cells=[DataCell(Text("...")), DataCell(Text(f"{hidden} more tokens not shown"))]))
 
     # Create the table
     table = ft.DataTable(
@@ -352,8 +426,7 @@ def main(page: ft.Page):
         - e: Event object (not used in the function but typically provided by event handlers).
         """
 
-        global build_counter
-        new_namespace
+        global build_counter, current_language
         build_counter = build_counter + 1
        
         rules_string = rules.value
@@ -362,61 +435,87 @@ def main(page: ft.Page):
 
         build_out = io.StringIO()        
         sys.stdout= build_out 
-
-        # Generate a timestamp string for uniquely naming files
-        global timestamp_str
-        timestamp_str = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
-
-        if build_counter > 1:
-            new_namespace.clear()
-
-        exec(rules_string, globals())
-        exec(rules_string, new_namespace)
+        try:
+            # Load the provided language rules into an in-memory module for PLY
+            rules_hash = hashlib.sha1(rules_string.encode()).hexdigest()
+            ply_module = types.ModuleType(f'ply_module_{build_counter}')
+            ply_module.__file__ = f'<rules_{rules_hash[:16]}>'
+            # PLY looks up the source of the rules, e.g. when pickling parser tables
+            linecache.cache[ply_module.__file__] = (len(rules_string), None, rules_string.splitlines(True), ply_module.__file__)
+
+            # Only compile rules that have not been built before
+            code_obj = code_cache.get(rules_string)
+            if code_obj is None:
+                code_obj = compile(rules_string, ply_module.__file__, 'exec')
+                code_cache[rules_string] = code_obj
+            exec(code_obj, ply_module.__dict__)
+            # Only the current language's module needs to stay importable for PLY
+            sys.modules.pop(f'ply_module_{build_counter - 1}', None)
+            sys.modules[ply_module.__name__] = ply_module
+
+            # Build the lexer and parser once per language so compiles can reuse them.
+            # The LALR tables are pickled per set of rules, so rebuilding identical
+            # rules loads them instead of regenerating them.
+            build_lexer = lex.lex(module=ply_module)
+            os.makedirs(parser_tables_dir, exist_ok=True)
+            if any(name.startswith('p_') and name != 'p_error' for name in vars(ply_module)):
+                picklefile = os.path.join(parser_tables_dir, f'parser_{rules_hash}.pickle')
+                try:
+                    build_parser = yacc.yacc(write_tables=False, debug=True, debuglog=yacc.NullLogger(), module=ply_module, picklefile=picklefile)
+                except (pickle.UnpicklingError, EOFError):
+                    # The table file was left truncated (e.g. an interrupted build), so regenerate it
+                    if os.path.exists(picklefile):
+                        os.remove(picklefile)
+                    build_parser = yacc.yacc(write_tables=False, debug=True, debuglog=yacc.NullLogger(), module=ply_module, picklefile=picklefile)
+            else:
+                build_parser = None  # Lexer-only language
+            current_language = (build_lexer, build_parser)
         
-        patterns = get_patterns_from_module(new_namespace)
+            patterns = get_patterns_from_module(vars(ply_module))
         
-        # Generate the NFA code string and execute it
-        gen_nfa = generate_nfa(patterns)
-        exec(gen_nfa)
-
-        # Update the UI with token types
-        items = []
-        items.append(ft.Container(content=ft.Text("Token Types: ", weight=ft.FontWeight.BOLD), padding=5
-                                  ))
-        for key in patterns:
-            items.append(
-                ft.Container(
-                    content=ft.Text(key),
-                    alignment=ft.alignment.center,
-                    padding=5,
-                )
+            # Generate and visualize the NFA for the token patterns
+            states, input_symbols, transitions, final_states = generate_nfa(patterns)
+            nfa = NFA(
+                states=states,
+                input_symbols=input_symbols,
+                transitions=transitions,
+                initial_state='Start',
+                final_states=final_states
             )
+            nfa_image = visualize_nfa(nfa, 'nfa')
+
+            # Update the UI with token types
+            items = []
+            items.append(ft.Container(content=ft.Text("Token Types: ", weight=ft.FontWeight.BOLD), padding=5
+                                      ))
+            for key in patterns:
+                items.append(
+                    ft.Container(
+                        content=ft.Text(key),
+                        alignment=ft.alignment.center,
+                        padding=5,
+                    )
+                )
         
-        token_container.content = ft.Row(controls=items)
-        token_container.border = ft.border.all(3, ft.colors.BLACK)
+            token_container.content = ft.Row(controls=items)
+            token_container.border = ft.border.all(3, ft.colors.BLACK)
 
-        # Update the terminal output in the UI
-        if build_out.getvalue():
-            text_output = ("terminal output >>> " + build_out.getvalue())
-        else:
-            text_output = ""
-        terminal_output.content = ft.Text(text_output, selectable=True)
-        terminal_output.update()
-        
-        sys.stdout = old_out
+            # Update the terminal output in the UI
+            if build_out.getvalue():
+                text_output = ("terminal output >>> " + build_out.getvalue())
+            else:
+                text_output = ""
+            terminal_output.content = ft.Text(text_output, selectable=True)
+            terminal_output.update()
+        finally:
+            # Restore stdout even if the rules fail to load or build
+            sys.stdout = old_out
         
         # Update the automata visualization in the UI
-        automata_container.content = ft.Image(src=f"nfa_{timestamp_str}.png", width=600, height=600)
+        automata_container.content = ft.Image(src=nfa_image, width=600, height=600)
         
-        # Save the provided language rules to a Python file
-        with open(f'ply_module_{build_counter}.py', 'w') as f:
-            f.write(rules_string)
-        
-        
-        column.update()
-    
-    global lexers
-    lexers = []
+        # Only send the containers that changed to the client
+        page.update(token_container, automata_container)
     
     def compile_button_click(e):
         
@@ -434,12 +533,13 @@ def main(page: ft.Page):
         result_message_container.border=ft.border.all(3, ft.colors.BLACK)
         result_message_container.padding=5
 
-        global ast_timestamp_string
-        global sym_table, sem_errors
+        global sym_table, sym_table_set, sem_errors
 
         # Clear previous symbol table and semantic error lists
         global sem_visual_removed
         sym_table.clear()
+        sym_table_set.clear()
+        value_to_type.clear()
         sem_errors.clear()
         if sem_visual_removed == False:
             errors_container.content = None
@@ -460,18 +560,13 @@ def main(page: ft.Page):
         compile_out = io.StringIO()        
         sys.stdout= compile_out
         
-        # Build the lexer using the PLY library
-        build_lexer = f'''import ply_module_{build_counter} \nlexers.append(lex.lex(module = ply_module_{build_counter}))'''
-        exec(build_lexer, globals())
-
-        global lex_counter
-        lex_counter = lex_counter + 1
-        
-        global lexer
-        lexers[lex_counter-1].input(code_string)
+        # Reuse the lexer and parser built for the current language
+        cached_lexer, parser = current_language
+        lexer = cached_lexer.clone()
+        lexer.input(code_string)
        
         # Display lexical analysis results in the UI
-        table = get_lex_table(lexers[lex_counter-1])
+        table = get_lex_table(lexer)
         lex_container.content = table
         lex_result_message_cont.content = ft.Text("Lexical")
         label_result_message_cont.content = ft.Text("")
@@ -485,13 +580,15 @@ def main(page: ft.Page):
         terminal_output2.content = ft.Text(text_output)
         terminal_output2.update()
         
-        column2.update()
-        
+        page.update(result_message_container, lex_container, errors_container, sym_table_container)
+
+        if parser is None:
+            sys.stdout = old_out
+            return
 
-        # Build the parser and generate the Abstract Syntax Tree (AST)
-        ast_timestamp_string = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
-        build_parser = f'''parser = yacc.yacc(write_tables=False, module=ply_module_{build_counter}) \nast = parser.parse(code_string, lexers[-1])'''
-        exec(build_parser, globals())
+        # Generate the Abstract Syntax Tree (AST)
+        global ast
+        ast = parser.parse(code_string, lexer)
         
         if compile_out.getvalue():
             text_output = ("terminal output >>> " + compile_out.getvalue())
@@ -502,33 +599,25 @@ def main(page: ft.Page):
         terminal_output2.update()
 
         sys.stdout = old_out
-
-        global ast
-        
-        if ((type(ast[0]) is tuple) and (type(ast[0][0]) is tuple)):
-            ast = ast[0] + (ast[1],)
         
         # Visualize and display the AST in the UI
-        visualize_ast(ast, f'ast_tree_{ast_timestamp_string}')
-        syntax_container.content = ft.Image(src=f"ast_tree_{ast_timestamp_string}.png", width=600, height=400, fit=ft.ImageFit.CONTAIN)
+        ast_image = visualize_ast(ast, 'ast_tree')
+        syntax_container.content = ft.Image(src=ast_image, width=600, height=400, fit=ft.ImageFit.CONTAIN)
         parse_result_message_cont.content = ft.Text("Syntax")
         label_result_message_cont.content = ft.Text("")
        
-        column2.update()
+        page.update(result_message_container, syntax_container)
 
         if sem_checkbox.value and (not assignment_token_input.value or not symbol_token_input.value):
             column2.controls.append(ft.Text("Please specify the Assignment Token and Variable Symbol Token for semantic analysis."))
+            column2.update()
             return  
 
-        
-        global type_to_value
-        assignment_op = type_to_value.get(assignment_token_input.value)
-
 
         # Perform semantic analysis if selected in the UI
         if sem_checkbox.value == True:
             
-            traverse_ast_for_semantics(ast, assignment_op, symbol_token_input.value)
+            traverse_ast_for_semantics(ast, assignment_token_input.value, symbol_token_input.value)
 
             if not sem_errors:
                 sem_errors.append(["None", "None"])
@@ -541,17 +630,16 @@ def main(page: ft.Page):
 
             sem_visual_removed = False
 
-            column2.update()
+            page.update(result_message_container, errors_container, sym_table_container)
     
     def checkbox_changed(e):
         if sem_checkbox.value == True:
             sem_container.content = assign_tooltip
             sem_container2.content = symbol_tooltip
-            column2.update()
         else:
             sem_container.content = None
             sem_container2.content = None
-            column2.update()
+        page.update(sem_container, sem_container2)
     
 
 